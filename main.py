@@ -1,8 +1,11 @@
 import os
 import json
+import time
 import random
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 from flask import Flask, request
 
@@ -49,6 +52,8 @@ class JSONDatabase:
         self.points_file = DATA_DIR / "points.json"
         self.transactions_file = DATA_DIR / "transactions.json"
         self.purchases_file = DATA_DIR / "purchases.json"
+        self.lock = asyncio.Lock()
+        self.lock_stats = {"acquisitions": 0, "contended": 0, "wait_time": 0.0}
         self._initialize_files()
 
     def _initialize_files(self):
@@ -68,13 +73,36 @@ class JSONDatabase:
         with open(file, 'w') as f:
             json.dump(data, f, indent=4)
 
-    async def get_user(self, user_id: int) -> Dict:
+    @asynccontextmanager
+    async def _locked(self):
+        # Each public method does its whole read-modify-write inside one of these
+        # sections; that is what keeps balances consistent today. File access is
+        # synchronous, so on one event loop the lock is never actually contended
+        # yet. It and lock_stats are there for when a section starts to await
+        # (async I/O, caching, batching), so the change can be shown to be safe.
+        # acquire() also blocks when the lock was just released but other
+        # coroutines are still queued for it, so count those waits too.
+        waiters = getattr(self.lock, "_waiters", None) or ()
+        contended = self.lock.locked() or any(not waiter.cancelled() for waiter in waiters)
+        started = time.perf_counter()
+        async with self.lock:
+            self.lock_stats["acquisitions"] += 1
+            self.lock_stats["contended"] += int(contended)
+            self.lock_stats["wait_time"] += time.perf_counter() - started
+            yield
+
+    async def _suspend(self):
+        # Await point between the read and the write of a balance or points
+        # update. A no-op while file access is synchronous; tests swap in
+        # asyncio.sleep(0) to simulate I/O that yields to the event loop.
+        pass
+
+    def _load_user(self, user_id: int) -> Dict:
         data = self._read_data(self.users_file)
         return data.get(str(user_id), {})
 
-    async def create_user(self, user_id: int) -> Dict:
-        data = self._read_data(self.users_file)
-        user_data = {
+    def _new_user(self) -> Dict:
+        return {
             "tokens": 0,
             "points": 0,
             "total_words": 0,
@@ -82,62 +110,118 @@ class JSONDatabase:
             "last_points_reset": None,
             "last_token_claim": None
         }
-        data[str(user_id)] = user_data
-        self._write_data(self.users_file, data)
-        return user_data
 
-    async def update_user(self, user_id: int, update_data: Dict):
+    def _save_user(self, user_id: int, update_data: Dict) -> Dict:
         data = self._read_data(self.users_file)
-        if str(user_id) not in data:
-            await self.create_user(user_id)
-            data = self._read_data(self.users_file)
-        
-        data[str(user_id)].update(update_data)
+        user_data = data.setdefault(str(user_id), self._new_user())
+        user_data.update(update_data)
         self._write_data(self.users_file, data)
+        return user_data
 
-    async def get_points(self, user_id: int) -> int:
-        data = self._read_data(self.points_file)
-        return data.get(str(user_id), 0)
-
-    async def add_points(self, user_id: int, points: int):
-        data = self._read_data(self.points_file)
-        current = data.get(str(user_id), 0)
-        data[str(user_id)] = current + points
-        self._write_data(self.points_file, data)
-
-        # Update total words in user data
-        user_data = await self.get_user(user_id)
-        await self.update_user(user_id, {"total_words": user_data.get("total_words", 0) + (points * 5)})
-
-    async def record_transaction(self, user_id: int, amount: int, reason: str):
+    def _append_transaction(self, user_id: int, amount: int, reason: str):
         data = self._read_data(self.transactions_file)
         if str(user_id) not in data:
             data[str(user_id)] = []
-        
+
         transaction = {
             "amount": amount,
             "reason": reason,
             "timestamp": datetime.utcnow().isoformat(),
-            "balance": (await self.get_user(user_id)).get("tokens", 0)
+            "balance": self._load_user(user_id).get("tokens", 0)
         }
         data[str(user_id)].append(transaction)
         self._write_data(self.transactions_file, data)
 
+    async def get_user(self, user_id: int) -> Dict:
+        async with self._locked():
+            return self._load_user(user_id)
+
+    async def create_user(self, user_id: int) -> Dict:
+        async with self._locked():
+            data = self._read_data(self.users_file)
+            if str(user_id) in data:
+                return data[str(user_id)]  # Created concurrently; don't wipe its balance
+            user_data = self._new_user()
+            data[str(user_id)] = user_data
+            self._write_data(self.users_file, data)
+            return user_data
+
+    async def update_user(self, user_id: int, update_data: Dict):
+        async with self._locked():
+            self._save_user(user_id, update_data)
+
+    async def adjust_tokens(self, user_id: int, amount: int, reason: str) -> Optional[int]:
+        """Atomically add ``amount`` tokens and record the transaction.
+
+        Returns the new balance, or ``None`` if it would drop below zero.
+        """
+        async with self._locked():
+            return await self._add_tokens(user_id, amount, reason)
+
+    async def convert_points(self, user_id: int, threshold: int, tokens: int, reason: str) -> Optional[int]:
+        """Atomically swap the user's points for ``tokens`` tokens.
+
+        Resets the points and credits the tokens in one critical section, so a
+        balance is only ever credited once per ``threshold`` points. Returns the
+        new balance, or ``None`` if the user has fewer than ``threshold`` points.
+        """
+        async with self._locked():
+            data = self._read_data(self.points_file)
+            if data.get(str(user_id), 0) < threshold:
+                return None
+            await self._suspend()
+            data[str(user_id)] = 0
+            self._write_data(self.points_file, data)
+            return await self._add_tokens(user_id, tokens, reason, {"points": 0})
+
+    async def _add_tokens(self, user_id: int, amount: int, reason: str, update_data: Optional[Dict] = None) -> Optional[int]:
+        # Callers must hold the lock.
+        new_balance = self._load_user(user_id).get("tokens", 0) + amount
+        if new_balance < 0:
+            return None
+        await self._suspend()
+        self._save_user(user_id, {**(update_data or {}), "tokens": new_balance})
+        self._append_transaction(user_id, amount, reason)
+        return new_balance
+
+    async def get_points(self, user_id: int) -> int:
+        async with self._locked():
+            data = self._read_data(self.points_file)
+            return data.get(str(user_id), 0)
+
+    async def add_points(self, user_id: int, points: int):
+        async with self._locked():
+            data = self._read_data(self.points_file)
+            current = data.get(str(user_id), 0)
+            await self._suspend()
+            data[str(user_id)] = current + points
+            self._write_data(self.points_file, data)
+
+            # Update total words in user data
+            user_data = self._load_user(user_id)
+            self._save_user(user_id, {"total_words": user_data.get("total_words", 0) + (points * 5)})
+
+    async def record_transaction(self, user_id: int, amount: int, reason: str):
+        async with self._locked():
+            self._append_transaction(user_id, amount, reason)
+
     async def record_purchase(self, user_id: int, item_name: str, price: int):
-        data = self._read_data(self.purchases_file)
-        if str(user_id) not in data:
-            data[str(user_id)] = []
-        
-        purchase = {
-            "item": item_name,
-            "price": price,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        data[str(user_id)].append(purchase)
-        self._write_data(self.purchases_file, data)
+        async with self._locked():
+            data = self._read_data(self.purchases_file)
+            if str(user_id) not in data:
+                data[str(user_id)] = []
+
+            purchase = {
+                "item": item_name,
+                "price": price,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+            data[str(user_id)].append(purchase)
+            self._write_data(self.purchases_file, data)
 
     async def get_all_users(self) -> Dict:
-        return self._read_data(self.users_file)
+        async with self._locked():
+            return self._read_data(self.users_file)
 
 # Initialize database
 db = JSONDatabase()
@@ -251,6 +335,78 @@ VRT_PASSES = {
     }
 }
 
+# Item search index for /buy autocomplete
+AUTOCOMPLETE_LIMIT = 25  # Discord's maximum number of autocomplete choices
+
+class ItemIndex:
+    """Precomputed prefix and trigram lookups over shop item names and descriptions.
+
+    Every prefix result is ranked and capped when the index is built, so a
+    keystroke costs a single dict lookup instead of a scan of the catalog.
+    """
+
+    def __init__(self, items: Dict[str, Dict], limit: int = AUTOCOMPLETE_LIMIT):
+        self.limit = limit
+        self.names = list(items)
+        self.exact = {name.casefold(): name for name in self.names}
+        # Name and description are kept apart so a substring match cannot span both.
+        self.texts = [(name.casefold(), data["description"].casefold()) for name, data in items.items()]
+        self.choices = {
+            name: app_commands.Choice(name=f"{name} - {data['price']:,} VRT", value=name)
+            for name, data in items.items()
+        }
+
+        # Rank: 0 = item name starts with the prefix, 1 = a word in the name does,
+        # 2 = a word in the description does. Ties keep catalog order.
+        ranks: Dict[str, Dict[int, int]] = {}
+        trigrams: Dict[str, set] = {}
+        for order, (folded_name, folded_description) in enumerate(self.texts):
+            sources = [(0, [folded_name]), (1, folded_name.split()), (2, folded_description.split())]
+            for rank, words in sources:
+                for word in words:
+                    for end in range(1, len(word) + 1):
+                        best = ranks.setdefault(word[:end], {})
+                        best[order] = min(best.get(order, rank), rank)
+
+            for text in self.texts[order]:
+                for start in range(len(text) - 2):
+                    trigrams.setdefault(text[start:start + 3], set()).add(order)
+
+        self.prefixes: Dict[str, List[str]] = {
+            prefix: [self.names[order] for order in sorted(best, key=lambda o: (best[o], o))[:limit]]
+            for prefix, best in ranks.items()
+        }
+        self.trigrams = trigrams
+        self.default = self.names[:limit]
+
+    def resolve(self, query: str) -> Optional[str]:
+        """Return the catalog name matching ``query`` case-insensitively, if any."""
+        return self.exact.get(query.strip().casefold())
+
+    def search(self, query: str) -> List[str]:
+        query = query.strip().casefold()
+        if not query:
+            return self.default
+        if query in self.prefixes:
+            return self.prefixes[query]
+        if len(query) < 3:
+            return []
+
+        # Substring fallback: intersect the posting sets of the query's trigrams,
+        # then confirm the candidates (never the whole catalog).
+        candidates = None
+        for start in range(len(query) - 2):
+            postings = self.trigrams.get(query[start:start + 3])
+            if not postings:
+                return []
+            candidates = postings if candidates is None else candidates & postings
+            if not candidates:
+                return []
+        matches = sorted(order for order in candidates if any(query in text for text in self.texts[order]))
+        return [self.names[order] for order in matches[:self.limit]]
+
+item_index = ItemIndex(SHOP_ITEMS)
+
 # Shop View
 class ShopView(discord.ui.View):
     def __init__(self):
@@ -373,6 +529,32 @@ class ShopView(discord.ui.View):
         else:
             await interaction.response.defer()
 
+# Message points
+POINTS_PER_CONVERSION = 150
+
+async def award_message_points(user_id: int, content: str) -> Optional[Tuple[int, int]]:
+    """Credit points for a message and convert them to tokens at the threshold.
+
+    Returns ``(tokens_added, new_balance)`` when a conversion happened.
+    """
+    # Count words (5 words = 1 point)
+    word_count = len(content.split())
+    points_to_add = word_count // 5
+    if points_to_add <= 0:
+        return None
+
+    await db.add_points(user_id, points_to_add)
+
+    # Check if points reach threshold for tokens
+    if await db.get_points(user_id) < POINTS_PER_CONVERSION:
+        return None
+
+    tokens_to_add = random.randint(60, 75)
+    new_balance = await db.convert_points(user_id, POINTS_PER_CONVERSION, tokens_to_add, "Weekly points conversion")
+    if new_balance is None:
+        return None  # Another message converted these points first
+    return tokens_to_add, new_balance
+
 # Bot events
 @bot.event
 async def on_ready():
@@ -392,35 +574,113 @@ async def on_message(message):
     # Process commands
     await bot.process_commands(message)
 
-    # Count words (5 words = 1 point)
-    word_count = len(message.content.split())
-    points_to_add = word_count // 5
-    
-    if points_to_add > 0:
-        await db.add_points(message.author.id, points_to_add)
-
-        # Check if points reach threshold for tokens
-        points = await db.get_points(message.author.id)
-        if points >= 150:
-            tokens_to_add = random.randint(60, 75)
-            user_data = await db.get_user(message.author.id)
-            await db.update_user(message.author.id, {
-                "tokens": user_data.get("tokens", 0) + tokens_to_add,
-                "points": 0  # Reset points after conversion
-            })
-            await db.record_transaction(message.author.id, tokens_to_add, "Weekly points conversion")
-            
-            # Notify user
-            try:
-                embed = discord.Embed(
-                    title="🎉 Points Converted to VRT Tokens!",
-                    description=f"You've earned {tokens_to_add} VRT tokens from your message points!",
-                    color=discord.Color.green()
-                )
-                embed.add_field(name="New Balance", value=f"{user_data.get('tokens', 0) + tokens_to_add} VRT")
-                await message.author.send(embed=add_footer(embed))
-            except discord.Forbidden:
-                pass  # User has DMs disabled
+    conversion = await award_message_points(message.author.id, message.content)
+    if conversion:
+        tokens_to_add, new_balance = conversion
+
+        # Notify user
+        try:
+            embed = discord.Embed(
+                title="🎉 Points Converted to VRT Tokens!",
+                description=f"You've earned {tokens_to_add} VRT tokens from your message points!",
+                color=discord.Color.green()
+            )
+            embed.add_field(name="New Balance", value=f"{new_balance} VRT")
+            await message.author.send(embed=add_footer(embed))
+        except discord.Forbidden:
+            pass  # User has DMs disabled
+
+# Command helpers shared by the prefix and slash commands
+def build_balance_embed(user, user_data: Dict) -> discord.Embed:
+    embed = discord.Embed(
+        title=f"{user.display_name}'s Balance",
+        color=discord.Color.blurple()
+    )
+    embed.add_field(name="VRT Tokens", value=f"{user_data.get('tokens', 0):,}", inline=True)
+    embed.add_field(name="Points", value=f"{user_data.get('points', 0):,}", inline=True)
+    embed.add_field(name="Total Words", value=f"{user_data.get('total_words', 0):,}", inline=False)
+    embed.set_thumbnail(url=user.display_avatar.url)
+    return add_footer(embed)
+
+async def get_balance_embed(user) -> discord.Embed:
+    user_data = await db.get_user(user.id)
+    if not user_data:
+        user_data = await db.create_user(user.id)
+    return build_balance_embed(user, user_data)
+
+async def process_purchase(user, item: str) -> Union[discord.Embed, str]:
+    """Charge ``user`` for ``item`` and return the confirmation embed, or an error message."""
+    item = item_index.resolve(item)
+    if item is None:
+        return "❌ That item doesn't exist in the shop!"
+
+    if not await db.get_user(user.id):
+        await db.create_user(user.id)
+
+    item_data = SHOP_ITEMS[item]
+
+    # Process purchase
+    new_balance = await db.adjust_tokens(user.id, -item_data["price"], f"Purchased {item}")
+    if new_balance is None:
+        user_data = await db.get_user(user.id)
+        return (
+            f"❌ You don't have enough VRT tokens for this purchase!\n"
+            f"You need {item_data['price']:,} VRT but only have {user_data.get('tokens', 0):,} VRT."
+        )
+
+    await db.record_purchase(user.id, item, item_data["price"])
+
+    embed = discord.Embed(
+        title="✅ Purchase Successful!",
+        description=f"Thank you for purchasing **{item}**!",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="Item Price", value=f"{item_data['price']:,} VRT", inline=True)
+    embed.add_field(name="New Balance", value=f"{new_balance:,} VRT", inline=True)
+    embed.add_field(
+        name="Next Steps",
+        value="Please open a ticket in our server to claim your prize.",
+        inline=False
+    )
+    return add_footer(embed)
+
+async def log_purchase(user, item: str):
+    log_channel_id = os.getenv("LOG_CHANNEL_ID")
+    if not log_channel_id:
+        return
+    log_channel = bot.get_channel(int(log_channel_id))
+    if log_channel:
+        item = item_index.resolve(item)
+        log_embed = discord.Embed(
+            title="🛒 New Purchase",
+            description=f"**User:** {user.mention} (`{user.id}`)\n"
+                        f"**Item:** {item}\n"
+                        f"**Price:** {SHOP_ITEMS[item]['price']:,} VRT",
+            color=discord.Color.orange()
+        )
+        log_embed.set_thumbnail(url=user.display_avatar.url)
+        await log_channel.send(content="<@&MOD_ROLE_ID>", embed=add_footer(log_embed))
+
+def build_transactions_embed(user_id: int, limit: int) -> Optional[discord.Embed]:
+    data = db._read_data(db.transactions_file)
+    user_transactions = data.get(str(user_id), [])[-limit:][::-1]  # Get latest transactions
+    if not user_transactions:
+        return None
+
+    embed = discord.Embed(
+        title=f"Your Recent Transactions (Last {len(user_transactions)})",
+        color=discord.Color.blurple()
+    )
+
+    for tx in user_transactions:
+        amount = tx["amount"]
+        embed.add_field(
+            name=f"{'+' if amount > 0 else ''}{amount:,} VRT - {tx['reason']}",
+            value=f"<t:{int(datetime.fromisoformat(tx['timestamp']).timestamp())}:R>\n"
+                  f"Balance: {tx['balance']:,} VRT",
+            inline=False
+        )
+    return add_footer(embed)
 
 class Economy(commands.Cog):
     def __init__(self, bot):
@@ -428,20 +688,7 @@ class Economy(commands.Cog):
 
     @commands.command(name="balance", description="Check your VRT token and points balance")
     async def balance(self, ctx):
-        user_data = await db.get_user(ctx.author.id)
-        if not user_data:
-            user_data = await db.create_user(ctx.author.id)
-        
-        embed = discord.Embed(
-            title=f"{ctx.author.display_name}'s Balance",
-            color=discord.Color.blurple()
-        )
-        embed.add_field(name="VRT Tokens", value=f"{user_data.get('tokens', 0):,}", inline=True)
-        embed.add_field(name="Points", value=f"{user_data.get('points', 0):,}", inline=True)
-        embed.add_field(name="Total Words", value=f"{user_data.get('total_words', 0):,}", inline=False)
-        embed.set_thumbnail(url=ctx.author.display_avatar.url)
-        
-        await ctx.send(embed=add_footer(embed))
+        await ctx.send(embed=await get_balance_embed(ctx.author))
 
     @commands.command(name="shop", description="Browse the VRT shop items and passes")
     async def shop(self, ctx):
@@ -451,85 +698,23 @@ class Economy(commands.Cog):
 
     @commands.command(name="buy", description="Purchase an item from the VRT shop")
     async def buy(self, ctx, *, item: str):
-        if item not in SHOP_ITEMS:
-            await ctx.send("❌ That item doesn't exist in the shop!")
-            return
-        
-        user_data = await db.get_user(ctx.author.id)
-        if not user_data:
-            user_data = await db.create_user(ctx.author.id)
-        
-        item_data = SHOP_ITEMS[item]
-        
-        if user_data.get("tokens", 0) < item_data["price"]:
-            await ctx.send(
-                f"❌ You don't have enough VRT tokens for this purchase!\n"
-                f"You need {item_data['price']:,} VRT but only have {user_data.get('tokens', 0):,} VRT."
-            )
+        result = await process_purchase(ctx.author, item)
+        if isinstance(result, str):
+            await ctx.send(result)
             return
-        
-        # Process purchase
-        new_balance = user_data["tokens"] - item_data["price"]
-        await db.update_user(ctx.author.id, {"tokens": new_balance})
-        await db.record_transaction(ctx.author.id, -item_data["price"], f"Purchased {item}")
-        await db.record_purchase(ctx.author.id, item, item_data["price"])
-
-        # Send confirmation
-        embed = discord.Embed(
-            title="✅ Purchase Successful!",
-            description=f"Thank you for purchasing **{item}**!",
-            color=discord.Color.green()
-        )
-        embed.add_field(name="Item Price", value=f"{item_data['price']:,} VRT", inline=True)
-        embed.add_field(name="New Balance", value=f"{new_balance:,} VRT", inline=True)
-        embed.add_field(
-            name="Next Steps", 
-            value="Please open a ticket in our server to claim your prize.", 
-            inline=False
-        )
-        
-        await ctx.send(embed=add_footer(embed))
 
-        # Log purchase
-        log_channel_id = os.getenv("LOG_CHANNEL_ID")
-        if log_channel_id:
-            log_channel = self.bot.get_channel(int(log_channel_id))
-            if log_channel:
-                log_embed = discord.Embed(
-                    title="🛒 New Purchase",
-                    description=f"**User:** {ctx.author.mention} (`{ctx.author.id}`)\n"
-                                f"**Item:** {item}\n"
-                                f"**Price:** {item_data['price']:,} VRT",
-                    color=discord.Color.orange()
-                )
-                log_embed.set_thumbnail(url=ctx.author.display_avatar.url)
-                await log_channel.send(content="<@&MOD_ROLE_ID>", embed=add_footer(log_embed))
+        await ctx.send(embed=result)
+        await log_purchase(ctx.author, item)
 
     @commands.command(name="transactions", description="View your recent VRT token transactions")
     async def transactions(self, ctx, limit: int = 5):
         limit = min(max(limit, 1), 10)  # Clamp between 1 and 10
-        data = db._read_data(db.transactions_file)
-        user_transactions = data.get(str(ctx.author.id), [])[-limit:][::-1]  # Get latest transactions
-        
-        if not user_transactions:
+        embed = build_transactions_embed(ctx.author.id, limit)
+        if embed is None:
             await ctx.send("You don't have any transactions yet.")
             return
-        
-        embed = discord.Embed(
-            title=f"Your Recent Transactions (Last {len(user_transactions)})",
-            color=discord.Color.blurple()
-        )
-        
-        for tx in user_transactions:
-            amount = tx["amount"]
-            embed.add_field(
-                name=f"{'+' if amount > 0 else ''}{amount:,} VRT - {tx['reason']}",
-                value=f"<t:{int(datetime.fromisoformat(tx['timestamp']).timestamp())}:R>\n"
-                      f"Balance: {tx['balance']:,} VRT",
-                inline=False
-            )
-        
-        await ctx.send(embed=add_footer(embed))
+
+        await ctx.send(embed=embed)
 
     @commands.command(name="give", description="Give tokens to another user")
     @commands.has_permissions(administrator=True)
@@ -542,14 +727,8 @@ class Economy(commands.Cog):
         if not sender_data:
             sender_data = await db.create_user(ctx.author.id)
             
-        receiver_data = await db.get_user(member.id)
-        if not receiver_data:
-            receiver_data = await db.create_user(member.id)
-            
         # Update receiver's balance
-        new_balance = receiver_data.get("tokens", 0) + amount
-        await db.update_user(member.id, {"tokens": new_balance})
-        await db.record_transaction(member.id, amount, f"Received from {ctx.author.display_name}")
+        new_balance = await db.adjust_tokens(member.id, amount, f"Received from {ctx.author.display_name}")
         
         embed = discord.Embed(
             title="✅ Tokens Sent",
@@ -566,17 +745,10 @@ class Economy(commands.Cog):
             await ctx.send("Amount must be positive!")
             return
             
-        user_data = await db.get_user(member.id)
-        if not user_data:
-            user_data = await db.create_user(member.id)
-            
-        if user_data.get("tokens", 0) < amount:
+        new_balance = await db.adjust_tokens(member.id, -amount, f"Removed by {ctx.author.display_name}")
+        if new_balance is None:
             await ctx.send(f"{member.display_name} doesn't have enough tokens!")
             return
-            
-        new_balance = user_data["tokens"] - amount
-        await db.update_user(member.id, {"tokens": new_balance})
-        await db.record_transaction(member.id, -amount, f"Removed by {ctx.author.display_name}")
         
         embed = discord.Embed(
             title="✅ Tokens Removed",
@@ -683,6 +855,42 @@ class Economy(commands.Cog):
         
         await ctx.send(embed=add_footer(embed))
 
+# Slash commands
+@bot.tree.command(name="balance", description="Check your VRT token and points balance")
+async def balance_slash(interaction: discord.Interaction):
+    await interaction.response.send_message(embed=await get_balance_embed(interaction.user))
+
+@bot.tree.command(name="shop", description="Browse the VRT shop items and passes")
+async def shop_slash(interaction: discord.Interaction):
+    view = ShopView()
+    embed = view.create_items_embed(interaction)
+    await interaction.response.send_message(embed=embed, view=view)
+
+@bot.tree.command(name="buy", description="Purchase an item from the VRT shop")
+@app_commands.describe(item="The item to purchase")
+async def buy_slash(interaction: discord.Interaction, item: str):
+    result = await process_purchase(interaction.user, item)
+    if isinstance(result, str):
+        await interaction.response.send_message(result, ephemeral=True)
+        return
+
+    await interaction.response.send_message(embed=result)
+    await log_purchase(interaction.user, item)
+
+@buy_slash.autocomplete("item")
+async def buy_item_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    return [item_index.choices[name] for name in item_index.search(current)]
+
+@bot.tree.command(name="transactions", description="View your recent VRT token transactions")
+@app_commands.describe(limit="How many transactions to show (1-10)")
+async def transactions_slash(interaction: discord.Interaction, limit: app_commands.Range[int, 1, 10] = 5):
+    embed = build_transactions_embed(interaction.user.id, limit)
+    if embed is None:
+        await interaction.response.send_message("You don't have any transactions yet.", ephemeral=True)
+        return
+
+    await interaction.response.send_message(embed=embed)
+
 async def setup(bot):
     await bot.add_cog(Economy(bot))
 
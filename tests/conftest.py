@@ -0,0 +1,20 @@
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="session")
+def main(tmp_path_factory):
+    # main.py creates ./data and the JSON files on import; do that in a scratch
+    # directory so the test run never touches the repository's data folder.
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("bot"))
+    try:
+        return importlib.import_module("main")
+    finally:
+        os.chdir(cwd)
@@ -0,0 +1,90 @@
+import pytest
+
+
+@pytest.fixture(scope="module")
+def index(main):
+    return main.item_index
+
+
+def make_catalog(count):
+    return {
+        f"Item {i}": {"price": i, "category": "Test", "description": f"Test item number {i}"}
+        for i in range(count)
+    }
+
+
+def test_empty_query_returns_catalog_head(main, index):
+    assert index.search("") == list(main.SHOP_ITEMS)[:25]
+    assert index.search("   ") == index.search("")
+
+
+def test_prefix_is_case_folded(index):
+    assert index.search("pay") == ["15$ Paypal", "10$ Paypal", "5$ Paypal"]
+    assert index.search("PAYPAL") == index.search("paypal")
+    assert index.search("Nitro B") == ["Nitro Boost", "Nitro Basic"]
+
+
+def test_ranking_prefers_name_start_then_name_word_then_description(index):
+    # "Brawl Pass Plus" and "Brawl Pass" start with the query, "Pro Pass" and
+    # "200 gems skin" only mention Brawl Stars in their descriptions.
+    assert index.search("brawl") == ["Brawl Pass Plus", "Brawl Pass", "Pro Pass", "200 gems skin"]
+    # "Permanent role" starts with the query; "Big Customer" only has it in its description.
+    results = index.search("perm")
+    assert results.index("Permanent role") < results.index("Big Customer")
+
+
+def test_trigram_fallback_matches_substrings(index):
+    assert index.search("pass plus") == ["Brawl Pass Plus"]
+    assert index.search("ypal") == ["15$ Paypal", "10$ Paypal", "5$ Paypal"]
+    assert index.search("xyz") == []
+    assert index.search("qq") == []
+
+
+def test_trigram_fallback_does_not_span_name_and_description(index):
+    assert index.search("l get") == []
+
+
+def test_results_are_capped(main):
+    index = main.ItemIndex(make_catalog(40))
+    assert len(index.search("")) == 25
+    assert len(index.search("item")) == 25
+    assert len(index.search("tem num")) == 25
+    assert index.search("item") == [f"Item {i}" for i in range(25)]
+
+
+def test_resolve_is_case_and_whitespace_insensitive(index):
+    assert index.resolve("  15$ paypal ") == "15$ Paypal"
+    assert index.resolve("I AM RICH.") == "I am rich."
+    assert index.resolve("paypal") is None
+
+
+def test_choices_carry_the_catalog_name(index):
+    choice = index.choices["Nitro Basic"]
+    assert choice.value == "Nitro Basic"
+    assert choice.name == "Nitro Basic - 8,000 VRT"
+
+
+class RecordingTexts(list):
+    def __init__(self, texts):
+        super().__init__(texts)
+        self.touched = set()
+
+    def __getitem__(self, order):
+        self.touched.add(order)
+        return super().__getitem__(order)
+
+    def __iter__(self):
+        raise AssertionError("search scanned the whole catalog")
+
+
+def test_search_never_scans_the_catalog(main):
+    index = main.ItemIndex(make_catalog(500))
+    index.texts = RecordingTexts(index.texts)
+
+    index.search("item 4")
+    assert index.texts.touched == set()
+
+    # Only the trigram candidates are confirmed, not every item.
+    assert index.search("number 49") == ["Item 49"] + [f"Item {i}" for i in range(490, 500)]
+    assert index.texts.touched == {49} | set(range(490, 500))
+
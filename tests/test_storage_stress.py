@@ -0,0 +1,235 @@
+import asyncio
+import json
+import random
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+SEED = 20261019
+USERS = 50
+OPERATIONS = 3000
+STARTING_TOKENS = 5000
+CHEAP_ITEMS = ["+1 entry", "1 emoji", "1 sticker", "2 weeks role"]
+
+
+def make_user(user_id):
+    return SimpleNamespace(
+        id=user_id,
+        display_name=f"user{user_id}",
+        mention=f"<@{user_id}>",
+        display_avatar=SimpleNamespace(url="https://example.invalid/avatar.png"),
+        bot=False,
+    )
+
+
+class FakeContext:
+    def __init__(self, author):
+        self.author = author
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content if content is not None else kwargs.get("embed"))
+
+
+@pytest.fixture
+def db(main, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "DATA_DIR", tmp_path)
+    database = main.JSONDatabase()
+    monkeypatch.setattr(main, "db", database)
+    return database
+
+
+@pytest.fixture
+def yielding_io(db, monkeypatch):
+    # Simulate storage that suspends between reading and writing a balance.
+    async def suspend():
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(db, "_suspend", suspend)
+    return db
+
+
+def read_json(db, name):
+    return json.loads((db.users_file.parent / name).read_text())
+
+
+async def run_workload(main, seed=SEED, operation_count=OPERATIONS):
+    """Run interleaved message, buy, give and remove operations.
+
+    Returns the expected balance per user and the number of successful
+    operations of each kind; each of those should have left one transaction.
+    """
+    random.seed(seed)  # drives the randint(60, 75) points conversions
+    schedule = random.Random(seed)
+    users = [make_user(1000 + i) for i in range(USERS)]
+    admin = make_user(1)
+    cog = main.Economy(main.bot)
+    expected = {user.id: 0 for user in users}
+    successes = {"conversion": 0, "buy": 0, "give": 0, "remove": 0}
+
+    async def message(user, words):
+        await asyncio.sleep(0)
+        conversion = await main.award_message_points(user.id, " ".join(["word"] * words))
+        if conversion:
+            tokens_added, _ = conversion
+            expected[user.id] += tokens_added
+            successes["conversion"] += 1
+
+    async def buy(user, item):
+        await asyncio.sleep(0)
+        result = await main.process_purchase(user, item)
+        if not isinstance(result, str):
+            expected[user.id] -= main.SHOP_ITEMS[item]["price"]
+            successes["buy"] += 1
+
+    async def give(user, amount):
+        await asyncio.sleep(0)
+        ctx = FakeContext(admin)
+        await main.Economy.give.callback(cog, ctx, user, amount)
+        expected[user.id] += amount
+        successes["give"] += 1
+
+    async def remove(user, amount):
+        await asyncio.sleep(0)
+        ctx = FakeContext(admin)
+        await main.Economy.remove.callback(cog, ctx, user, amount)
+        if not isinstance(ctx.sent[-1], str):
+            expected[user.id] -= amount
+            successes["remove"] += 1
+
+    # Fund everyone up front so buys and removes succeed however the lock
+    # queue orders them.
+    for user in users:
+        await give(user, STARTING_TOKENS)
+    assert main.db.lock_stats["contended"] == 0
+    main.db.lock_stats.update(acquisitions=0, contended=0, wait_time=0.0)
+
+    operations = []
+    for _ in range(operation_count):
+        user = schedule.choice(users)
+        kind = schedule.choices(["message", "buy", "give", "remove"], weights=[6, 2, 1, 1])[0]
+        if kind == "message":
+            operations.append(message(user, schedule.randint(0, 400)))
+        elif kind == "buy":
+            operations.append(buy(user, schedule.choice(CHEAP_ITEMS)))
+        elif kind == "give":
+            operations.append(give(user, schedule.randint(100, 2000)))
+        else:
+            operations.append(remove(user, schedule.randint(50, 1500)))
+
+    await asyncio.gather(*operations)
+    return expected, successes
+
+
+def check_invariants(main, db, expected, successes):
+    users = read_json(db, "users.json")
+    transactions = read_json(db, "transactions.json")
+    purchases = read_json(db, "purchases.json")
+    points = read_json(db, "points.json")
+
+    for user_id, net in expected.items():
+        user_transactions = transactions.get(str(user_id), [])
+        balance = users.get(str(user_id), {}).get("tokens", 0)
+        assert balance == net
+        assert balance == sum(tx["amount"] for tx in user_transactions)
+        assert all(tx["balance"] >= 0 for tx in user_transactions)
+        assert balance >= 0
+        assert points.get(str(user_id), 0) < main.POINTS_PER_CONVERSION
+
+    assert sum(len(txs) for txs in transactions.values()) == sum(successes.values())
+    assert sum(len(items) for items in purchases.values()) == successes["buy"]
+    assert all(count > 0 for count in successes.values())
+
+
+def test_interleaved_economy_conserves_tokens(main, db):
+    expected, successes = asyncio.run(run_workload(main))
+    check_invariants(main, db, expected, successes)
+    # Critical sections never await, so no coroutine ever waits for the lock.
+    assert db.lock_stats["acquisitions"] > OPERATIONS
+    assert db.lock_stats["contended"] == 0
+    assert db.lock_stats["wait_time"] < 0.5
+
+
+def test_interleaved_economy_with_yielding_io(main, yielding_io):
+    db = yielding_io
+    expected, successes = asyncio.run(run_workload(main))
+    check_invariants(main, db, expected, successes)
+    # Every section suspends while held, so all but the first acquisition wait.
+    assert db.lock_stats["acquisitions"] > OPERATIONS
+    assert db.lock_stats["contended"] == db.lock_stats["acquisitions"] - 1
+    assert db.lock_stats["wait_time"] > 0
+
+
+def test_workload_is_deterministic(main, tmp_path, monkeypatch):
+    results = []
+    for run in range(2):
+        monkeypatch.setattr(main, "DATA_DIR", tmp_path / str(run))
+        (tmp_path / str(run)).mkdir()
+        database = main.JSONDatabase()
+        monkeypatch.setattr(main, "db", database)
+        asyncio.run(run_workload(main, operation_count=500))
+        results.append({user_id: data["tokens"] for user_id, data in read_json(database, "users.json").items()})
+    assert results[0] == results[1]
+
+
+def test_lock_prevents_lost_updates(yielding_io):
+    db = yielding_io
+
+    async def credit_all():
+        await asyncio.gather(*(db.adjust_tokens(1, 10, "credit") for _ in range(100)))
+
+    asyncio.run(credit_all())
+    assert read_json(db, "users.json")["1"]["tokens"] == 1000
+    assert db.lock_stats["contended"] == 99
+
+
+def test_contention_counts_queued_waiters(yielding_io):
+    # Each task re-acquires the lock straight after releasing it, while the
+    # next credit is woken but has not run yet. The lock reads as unlocked
+    # then, but acquire() still queues behind that waiter.
+    db = yielding_io
+
+    async def credit_then_check():
+        await db.adjust_tokens(1, 10, "credit")
+        await db.get_user(1)
+
+    async def run_all():
+        await asyncio.gather(*(credit_then_check() for _ in range(200)))
+
+    asyncio.run(run_all())
+    assert db.lock_stats["acquisitions"] == 400
+    assert db.lock_stats["contended"] == 399
+
+
+def test_without_lock_updates_are_lost(yielding_io, monkeypatch):
+    # Control for the test above: the same workload loses updates unguarded.
+    db = yielding_io
+
+    @asynccontextmanager
+    async def unlocked():
+        yield
+
+    monkeypatch.setattr(db, "_locked", unlocked)
+
+    async def credit_all():
+        await asyncio.gather(*(db.adjust_tokens(1, 10, "credit") for _ in range(100)))
+
+    asyncio.run(credit_all())
+    assert read_json(db, "users.json")["1"]["tokens"] < 1000
+
+
+def test_points_convert_once_per_threshold(main, yielding_io):
+    db = yielding_io
+    random.seed(SEED)
+
+    async def chat():
+        first = await main.award_message_points(7, " ".join(["word"] * 750))
+        again = await main.award_message_points(7, "five words in this message")
+        return first, again
+
+    first, again = asyncio.run(chat())
+    assert first is not None and 60 <= first[0] <= 75
+    assert again is None
+    assert read_json(db, "points.json")["7"] == 1
+    assert read_json(db, "users.json")["7"]["tokens"] == first[0]